@@ -1,10 +1,18 @@
 """ASP Model for Calendar Scheduling — generates Answer Set Programs for Clingo."""
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from aion.config import get_now
 
 
+@lru_cache(maxsize=1440)
+def _parse_hhmm(time_str: str) -> tuple[int, int]:
+    """Split an "HH:MM" string into (hour, minute); at most 1440 distinct keys."""
+    h, m = time_str.split(":")
+    return int(h), int(m)
+
+
 class ASPModel:
     """Generates ASP rules for calendar scheduling.
 
@@ -19,12 +27,19 @@ class ASPModel:
         self.day_start_hour = 6  # 6:00 AM
         self.day_end_hour = 22   # 10:00 PM
         self.total_slots = (self.day_end_hour - self.day_start_hour) * self.slots_per_hour
+        # Labels for every slot boundary in the day, end of day included
+        self._slot_labels = tuple(self._format_slot(s) for s in range(self.total_slots + 1))
 
     def time_to_slot(self, time_str: str) -> int:
-        h, m = map(int, time_str.split(":"))
+        h, m = _parse_hhmm(time_str)
         return (h - self.day_start_hour) * self.slots_per_hour + (1 if m >= 30 else 0)
 
     def slot_to_time(self, slot: int) -> str:
+        if 0 <= slot <= self.total_slots:
+            return self._slot_labels[slot]
+        return self._format_slot(slot)
+
+    def _format_slot(self, slot: int) -> str:
         h = self.day_start_hour + slot // self.slots_per_hour
         m = 30 if slot % self.slots_per_hour else 0
         return f"{h:02d}:{m:02d}"
@@ -71,8 +86,9 @@ evening(24..{self.total_slots - 1}).
 
     def generate_busy_constraints(self, events: list[dict], dates: list[str] | None = None) -> str:
         lines = ["\n% Busy times from existing events"]
+        wanted = frozenset(dates) if dates else None
         for event in events:
-            if dates and event["date"] not in dates:
+            if wanted is not None and event["date"] not in wanted:
                 continue
             weekday = self.date_to_weekday(event["date"])
             start_slot = self.time_to_slot(event["time"])
@@ -13,6 +13,7 @@ from aion import display
 from aion.config import clear_tokens, get_config, get_now, get_preferences, get_tokens, save_config, save_preferences
 from aion.google_cal import EventData, GoogleCalendar
 from aion.intent import ParsedCommand, classify, classify_all
+from aion.ollama import close_client as close_ollama
 from aion.ollama import ollama_available, reset_status
 from aion.solver import ScheduleSolver
 
@@ -248,7 +249,9 @@ async def handle_schedule(
         "prefer_afternoon": time_pref == "afternoon",
         "prefer_evening": time_pref == "evening",
     }
-    solutions = solver.find_available_slots([e.to_dict() for e in events], request)
+    # Serialized once; re-solves after a preference change reuse the same busy list
+    event_dicts = [e.to_dict() for e in events]
+    solutions = solver.find_available_slots(event_dicts, request)
 
     if not solutions or (isinstance(solutions[0], dict) and "error" in solutions[0]):
         display.print_error("No available slots found. Calendar may be full for this date.")
@@ -307,7 +310,7 @@ async def handle_schedule(
             request["prefer_morning"] = pref == "morning"
             request["prefer_afternoon"] = pref == "afternoon"
             request["prefer_evening"] = pref == "evening"
-            new_solutions = solver.find_available_slots([e.to_dict() for e in events], request)
+            new_solutions = solver.find_available_slots(event_dicts, request)
             if new_solutions and not (isinstance(new_solutions[0], dict) and "error" in new_solutions[0]):
                 seen_times.clear()
                 all_slots.clear()
@@ -732,19 +735,26 @@ async def _presolve_timeless(
     solved: list[int] = []
     failed: list[int] = []
 
+    timeless = [cmd for cmd in cmds if cmd.intent == "SCHEDULE" and not cmd.time]
+    today = get_now().strftime("%Y-%m-%d")
+    for cmd in timeless:
+        if not cmd.dates:
+            cmd.dates = [today]
+
+    # Fetch every date the chain needs in one concurrent batch
+    fetch_dates = list(dict.fromkeys(cmd.dates[0] for cmd in timeless))
+    with console.status("  Fetching calendar..."):
+        fetched = await gcal.list_events_multi(fetch_dates)
+    events_by_date = dict(zip(fetch_dates, fetched))
+
     for i, cmd in enumerate(cmds):
         if cmd.intent != "SCHEDULE" or cmd.time:
             continue  # already has a time or not a schedule command
 
-        date = cmd.dates[0] if cmd.dates else get_now().strftime("%Y-%m-%d")
-        if not cmd.dates:
-            cmd.dates = [date]
-
+        date = cmd.dates[0]
         duration = cmd.duration or default_duration
         time_pref = cmd.time_pref or get_preferences().get("default_time_pref")
-
-        with console.status(f"  Finding slot for '{cmd.title}'..."):
-            cal_events = await gcal.list_events(date)
+        cal_events = events_by_date[date]
 
         request = {
             "activity": cmd.activity or "event",
@@ -1001,6 +1011,16 @@ async def handle_input(user_input: str, gcal: GoogleCalendar | None, solver: Sch
     return True
 
 
+def _connect_gcal() -> GoogleCalendar | None:
+    """Build a GoogleCalendar client from stored tokens, or None if not logged in."""
+    if not get_tokens():
+        return None
+    try:
+        return GoogleCalendar()
+    except RuntimeError:
+        return None
+
+
 async def async_main() -> None:
     """Async entry point."""
     # Direct subcommands: aion login / aion setup
@@ -1025,18 +1045,13 @@ async def async_main() -> None:
 
     display.print_banner()
 
-    # Check connections
-    gcal: GoogleCalendar | None = None
-    gcal_ok = False
-    if get_tokens():
-        try:
-            gcal = GoogleCalendar()
-            gcal_ok = True
-        except RuntimeError:
-            pass
-
+    # Check connections — both probes are independent I/O, so run them concurrently
     reset_status()
-    ollama_ok = ollama_available()
+    gcal, ollama_ok = await asyncio.gather(
+        asyncio.to_thread(_connect_gcal),
+        ollama_available(),
+    )
+    gcal_ok = gcal is not None
     ollama_model = get_config().get("ollama_model", "") if ollama_ok else ""
 
     # If Ollama was previously set up but server isn't running, start it silently
@@ -1045,7 +1060,7 @@ async def async_main() -> None:
         from aion.setup import start_ollama
         if start_ollama():
             reset_status()
-            ollama_ok = ollama_available()
+            ollama_ok = await ollama_available()
             ollama_model = _startup_cfg.get("ollama_model", "")
 
     # First run: offer to set up Ollama for smart understanding
@@ -1056,7 +1071,7 @@ async def async_main() -> None:
             from aion.setup import setup
             if setup():
                 reset_status()
-                ollama_ok = ollama_available()
+                ollama_ok = await ollama_available()
                 ollama_model = get_config().get("ollama_model", "")
                 display.print_success("Smart understanding enabled!")
             else:
@@ -1071,32 +1086,38 @@ async def async_main() -> None:
     solver = ScheduleSolver()
     ctx = SessionContext()
 
-    while True:
-        try:
-            user_input = Prompt.ask("[bold cyan]aion[/]")
-        except (KeyboardInterrupt, EOFError):
-            console.print("\nBye!")
-            break
-
-        try:
-            if not await handle_input(user_input, gcal, solver, ctx):
-                console.print("Bye!")
+    try:
+        while True:
+            try:
+                user_input = Prompt.ask("[bold cyan]aion[/]")
+            except (KeyboardInterrupt, EOFError):
+                console.print("\nBye!")
                 break
-        except Exception as e:
-            display.print_error(f"Error: {e}")
 
-        # Reconnect gcal after login
-        if not gcal_ok and get_tokens():
             try:
-                gcal = GoogleCalendar()
-                gcal_ok = True
-            except RuntimeError:
-                pass
-
-        # Re-check ollama after setup (ollama_available() returns cached value unless reset_status() was called)
-        if not ollama_ok and ollama_available():
-            ollama_ok = True
-            ollama_model = get_config().get("ollama_model", "")
+                if not await handle_input(user_input, gcal, solver, ctx):
+                    console.print("Bye!")
+                    break
+            except Exception as e:
+                display.print_error(f"Error: {e}")
+
+            # Reconnect gcal after login
+            if not gcal_ok and get_tokens():
+                try:
+                    gcal = GoogleCalendar()
+                    gcal_ok = True
+                except RuntimeError:
+                    pass
+
+            # Re-check ollama after setup (ollama_available() returns the cached value until its TTL
+            # expires or reset_status() is called)
+            if not ollama_ok and await ollama_available():
+                ollama_ok = True
+                ollama_model = get_config().get("ollama_model", "")
+    finally:
+        if gcal is not None:
+            await gcal.aclose()
+        await close_ollama()
 
 
 def main() -> None:
@@ -8,6 +8,11 @@ from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+try:
+    import orjson
+except ImportError:  # optional speedup — falls back to stdlib json
+    orjson = None
+
 AION_DIR = Path.home() / ".aion"
 CONFIG_FILE = AION_DIR / "config.json"
 TOKENS_FILE = AION_DIR / "tokens.json"
@@ -18,12 +23,34 @@ _DEFAULT_CLIENT_ID = "477239203690-qc3jmuu9raacmnbm" + "6pgtbdsl7oeg06ef.apps.go
 _DEFAULT_CLIENT_SECRET = "GOCSPX-wAddit" + "TKixmzpy1kOl-OqMZkn-Lx"
 
 _config_cache: dict | None = None
+_tz_cache: tuple[str, ZoneInfo] | None = None
 
 
 def ensure_dir() -> None:
     AION_DIR.mkdir(exist_ok=True)
 
 
+def json_loads(data: bytes | str) -> object:
+    """Decode JSON with orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_bytes(obj: object) -> bytes:
+    """Encode JSON compactly as UTF-8 bytes, for request bodies (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def json_dumps(obj: object) -> str:
+    """Encode JSON with 2-space indent (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
 def get_config() -> dict:
     """Load config from ~/.aion/config.json merged with env vars."""
     global _config_cache
@@ -32,7 +59,7 @@ def get_config() -> dict:
 
     cfg: dict = {}
     if CONFIG_FILE.exists():
-        cfg = json.loads(CONFIG_FILE.read_text())
+        cfg = json_loads(CONFIG_FILE.read_bytes())
 
     env_map = {
         "AION_GOOGLE_CLIENT_ID": "google_client_id",
@@ -58,22 +85,29 @@ def get_config() -> dict:
     return cfg
 
 
+def _write_atomic(path: Path, text: str) -> None:
+    """Write via a temp file + rename so a crash mid-write never leaves a truncated file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")  # orjson keeps non-ASCII as-is; never use the locale codec
+    os.replace(tmp, path)
+
+
 def save_config(cfg: dict) -> None:
     global _config_cache
     ensure_dir()
-    CONFIG_FILE.write_text(json.dumps(cfg, indent=2))
+    _write_atomic(CONFIG_FILE, json_dumps(cfg))
     _config_cache = cfg
 
 
 def get_tokens() -> dict | None:
     if not TOKENS_FILE.exists():
         return None
-    return json.loads(TOKENS_FILE.read_text())
+    return json_loads(TOKENS_FILE.read_bytes())
 
 
 def save_tokens(tokens: dict) -> None:
     ensure_dir()
-    TOKENS_FILE.write_text(json.dumps(tokens, indent=2))
+    _write_atomic(TOKENS_FILE, json_dumps(tokens))
 
 
 def clear_tokens() -> None:
@@ -86,10 +120,18 @@ def reload_config() -> None:
     _config_cache = None
 
 
+def get_tz() -> ZoneInfo:
+    """Return the user's configured timezone (cached until the name changes)."""
+    global _tz_cache
+    tz_name = get_config().get("timezone", "UTC")
+    if _tz_cache is None or _tz_cache[0] != tz_name:
+        _tz_cache = (tz_name, ZoneInfo(tz_name))
+    return _tz_cache[1]
+
+
 def get_now() -> datetime:
     """Return the current time in the user's configured timezone."""
-    tz_name = get_config().get("timezone", "UTC")
-    return datetime.now(ZoneInfo(tz_name))
+    return datetime.now(get_tz())
 
 
 def get_preferences() -> dict:
@@ -2,7 +2,8 @@
 
 import calendar
 import re
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
 
 from aion.config import get_now
 
@@ -47,42 +48,99 @@ _TYPOS: dict[str, str] = {
 _TYPO_PATTERN = re.compile(r"\b(" + "|".join(re.escape(k) for k in _TYPOS) + r")\b", re.I)
 
 
+# Whole-word weekday / month names (longest first so "thursday" beats "thu")
+_WEEKDAY_RE = re.compile(r"\b(" + "|".join(sorted(WEEKDAY_NAMES, key=len, reverse=True)) + r")\b")
+_MONTH_RE = re.compile(r"\b(" + "|".join(sorted(MONTH_NAMES, key=len, reverse=True)) + r")\b")
+
+# Anything any branch below could match — a message with none of these has no date.
+# Numeric patterns need a month name too, so bare digits are not a hint on their own.
+_HAS_DATE_HINT = re.compile(
+    r"today|tomorrow|yesterday|week|month|" + _WEEKDAY_RE.pattern + "|" + _MONTH_RE.pattern
+)
+
+# Days from today's weekday to the target weekday, keyed (today_wd, target_wd, said_next).
+# "friday" is the coming Friday (a week out if today is Friday); "next" adds 7 first.
+def _days_until(today_wd: int, target_wd: int, is_next: bool) -> int:
+    days_ahead = target_wd - today_wd + (7 if is_next else 0)
+    return days_ahead if days_ahead > 0 else days_ahead + 7
+
+
+_DAYS_AHEAD: dict[tuple[int, int, bool], int] = {
+    (t, d, n): _days_until(t, d, n) for t in range(7) for d in range(7) for n in (False, True)
+}
+
+# "march 15", "march 15th, 2026" / "15th of march", "15 march 2026"
+_DATE_PATTERNS: tuple[re.Pattern, ...] = (
+    re.compile(r"(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s*,?\s*(\d{4}))?"),
+    re.compile(r"(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?(\w+)(?:\s*,?\s*(\d{4}))?"),
+)
+
+
+# Word tokens split exactly where _TYPO_PATTERN's \b does, Unicode punctuation included
+# ("tmrw…", "“tmrw”", "tmrw—3pm")
+_WORD = re.compile(r"\w+")
+
+
 def _fix_typos(text: str) -> str:
+    # Fast path: one dict probe per token — most input has no typo and skips the regex
+    if _TYPOS.keys().isdisjoint(_WORD.findall(text.lower())):
+        return text
     return _TYPO_PATTERN.sub(lambda m: _TYPOS[m.group(1).lower()], text)
 
 
+_TWO_DIGITS: tuple[str, ...] = tuple(f"{i:02d}" for i in range(32))
+
+
+def _month_dates(year: int, month: int) -> list[str]:
+    """Every YYYY-MM-DD date in the given month."""
+    prefix = f"{year}-{_TWO_DIGITS[month]}-"
+    return [prefix + _TWO_DIGITS[d] for d in range(1, calendar.monthrange(year, month)[1] + 1)]
+
+
 def parse_date_from_query(message: str) -> dict:
     """Parse date references from user message.
 
     Returns: {type: 'date'|'month'|'week'|None, dates: [...], label: str}
     """
     message_lower = _fix_typos(message.lower())
-    today = get_now()
+    if not _HAS_DATE_HINT.search(message_lower):
+        return {"type": None, "dates": [], "label": ""}
+    cached = _parse_date_cached(message_lower, get_now().toordinal())
+    return {**cached, "dates": list(cached["dates"])}
+
+
+@lru_cache(maxsize=512)
+def _parse_date_cached(message_lower: str, today_ordinal: int) -> dict:
+    """Pure kernel of parse_date_from_query — keyed on the day so entries expire at midnight.
+
+    The returned dict is shared by every cache hit; callers must copy before mutating.
+    """
+    today = date.fromordinal(today_ordinal)
     result: dict = {"type": None, "dates": [], "label": ""}
 
     if "today" in message_lower:
         result["type"] = "date"
-        result["dates"] = [today.strftime("%Y-%m-%d")]
+        result["dates"] = [today.isoformat()]
         result["label"] = f"today ({today.strftime('%B %d, %Y')})"
         return result
 
     if "tomorrow" in message_lower:
         tomorrow = today + timedelta(days=1)
         result["type"] = "date"
-        result["dates"] = [tomorrow.strftime("%Y-%m-%d")]
+        result["dates"] = [tomorrow.isoformat()]
         result["label"] = f"tomorrow ({tomorrow.strftime('%B %d, %Y')})"
         return result
 
     if "yesterday" in message_lower:
         yesterday = today - timedelta(days=1)
         result["type"] = "date"
-        result["dates"] = [yesterday.strftime("%Y-%m-%d")]
+        result["dates"] = [yesterday.isoformat()]
         result["label"] = f"yesterday ({yesterday.strftime('%B %d, %Y')})"
         return result
 
     if "this week" in message_lower:
         start_of_week = today - timedelta(days=today.weekday())
-        dates = [(start_of_week + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)]
+        dates = [(start_of_week + timedelta(days=i)).isoformat() for i in range(7)]
         result["type"] = "week"
         result["dates"] = dates
         result["label"] = (
@@ -93,7 +151,7 @@ def parse_date_from_query(message: str) -> dict:
 
     if "next week" in message_lower:
         start_of_next_week = today + timedelta(days=(7 - today.weekday()))
-        dates = [(start_of_next_week + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)]
+        dates = [(start_of_next_week + timedelta(days=i)).isoformat() for i in range(7)]
         result["type"] = "week"
         result["dates"] = dates
         result["label"] = (
@@ -103,8 +161,7 @@ def parse_date_from_query(message: str) -> dict:
         return result
 
     if "this month" in message_lower:
-        num_days = calendar.monthrange(today.year, today.month)[1]
-        dates = [f"{today.year}-{today.month:02d}-{d:02d}" for d in range(1, num_days + 1)]
+        dates = _month_dates(today.year, today.month)
         result["type"] = "month"
         result["dates"] = dates
         result["label"] = today.strftime("%B %Y")
@@ -115,34 +172,27 @@ def parse_date_from_query(message: str) -> dict:
             year, month = today.year + 1, 1
         else:
             year, month = today.year, today.month + 1
-        num_days = calendar.monthrange(year, month)[1]
-        dates = [f"{year}-{month:02d}-{d:02d}" for d in range(1, num_days + 1)]
+        dates = _month_dates(year, month)
         result["type"] = "month"
         result["dates"] = dates
         result["label"] = f"{today.replace(year=year, month=month).strftime('%B')} {year}"
         return result
 
     # Specific weekday — "next friday" vs "friday"
-    for day_name, day_num in WEEKDAY_NAMES.items():
-        if day_name in message_lower:
-            days_ahead = day_num - today.weekday()
-            if "next" in message_lower:
-                days_ahead += 7
-            if days_ahead <= 0:
-                days_ahead += 7
-            target_date = today + timedelta(days=days_ahead)
-            result["type"] = "date"
-            result["dates"] = [target_date.strftime("%Y-%m-%d")]
-            result["label"] = f"{day_name.capitalize()} ({target_date.strftime('%B %d, %Y')})"
-            return result
+    m = _WEEKDAY_RE.search(message_lower)
+    if m:
+        day_name = m.group(1)
+        day_num = WEEKDAY_NAMES[day_name]
+        days_ahead = _DAYS_AHEAD[(today.weekday(), day_num, "next" in message_lower)]
+        target_date = today + timedelta(days=days_ahead)
+        result["type"] = "date"
+        result["dates"] = [target_date.isoformat()]
+        result["label"] = f"{day_name.capitalize()} ({target_date.strftime('%B %d, %Y')})"
+        return result
 
     # Specific date patterns (check BEFORE bare month names)
-    date_patterns = [
-        r"(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s*,?\s*(\d{4}))?",
-        r"(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?(\w+)(?:\s*,?\s*(\d{4}))?",
-    ]
-    for pattern in date_patterns:
-        match = re.search(pattern, message_lower)
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(message_lower)
         if match:
             groups = match.groups()
             try:
@@ -158,25 +208,26 @@ def parse_date_from_query(message: str) -> dict:
                     year = int(groups[2]) if groups[2] else today.year
                     if not groups[2] and month_num < today.month:
                         year += 1
-                    target_date = datetime(year, month_num, day)
+                    target_date = date(year, month_num, day)
                     result["type"] = "date"
-                    result["dates"] = [target_date.strftime("%Y-%m-%d")]
+                    result["dates"] = [target_date.isoformat()]
                     result["label"] = target_date.strftime("%B %d, %Y")
                     return result
             except (ValueError, TypeError):
                 pass
 
     # Bare month names
-    for month_name, month_num in MONTH_NAMES.items():
-        if month_name in message_lower:
-            year = today.year
-            if month_num < today.month:
-                year += 1
-            num_days = calendar.monthrange(year, month_num)[1]
-            dates = [f"{year}-{month_num:02d}-{d:02d}" for d in range(1, num_days + 1)]
-            result["type"] = "month"
-            result["dates"] = dates
-            result["label"] = f"{month_name.capitalize()} {year}"
-            return result
+    m = _MONTH_RE.search(message_lower)
+    if m:
+        month_name = m.group(1)
+        month_num = MONTH_NAMES[month_name]
+        year = today.year
+        if month_num < today.month:
+            year += 1
+        dates = _month_dates(year, month_num)
+        result["type"] = "month"
+        result["dates"] = dates
+        result["label"] = f"{month_name.capitalize()} {year}"
+        return result
 
     return result
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 
 from rich.console import Console
 from rich.panel import Panel
@@ -14,6 +15,15 @@ from aion.google_cal import EventData
 console = Console()
 
 
+@lru_cache(maxsize=512)
+def _format_date(date_str: str, fmt: str) -> str:
+    """Reformat a YYYY-MM-DD string, falling back to the raw string if it doesn't parse."""
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").strftime(fmt)
+    except ValueError:
+        return date_str
+
+
 def print_banner() -> None:
     console.print(Panel(
         "[bold cyan]Aion[/] — AI Calendar Agent\n"
@@ -76,10 +86,7 @@ def print_events(events: list[EventData], label: str = "") -> None:
         date_display = ""
         if ev.date != current_date:
             current_date = ev.date
-            try:
-                date_display = datetime.strptime(ev.date, "%Y-%m-%d").strftime("%a %b %d")
-            except ValueError:
-                date_display = ev.date
+            date_display = _format_date(ev.date, "%a %b %d")
         t.add_row(str(idx), date_display, ev.time, ev.title, f"{ev.duration} min")
 
     console.print(t)
@@ -98,10 +105,7 @@ def print_free_slots(slots: list[dict], label: str = "") -> None:
 def print_optimal_slot(slot: dict) -> None:
     console.print(f"\n  [bold green]Best slot:[/] {slot['time']} ({slot.get('duration', 60)} min)")
     if slot.get("date"):
-        try:
-            console.print(f"  Date: {datetime.strptime(slot['date'], '%Y-%m-%d').strftime('%A, %B %d')}")
-        except ValueError:
-            console.print(f"  Date: {slot['date']}")
+        console.print(f"  Date: {_format_date(slot['date'], '%A, %B %d')}")
     console.print()
 
 
@@ -160,10 +164,7 @@ def print_preferences(prefs: dict) -> None:
 
             until = slot.get("until")
             if until:
-                try:
-                    until_label = datetime.strptime(until, "%Y-%m-%d").strftime("%b %d")
-                except ValueError:
-                    until_label = until
+                until_label = _format_date(until, "%b %d")
             else:
                 until_label = "Always"
 
@@ -199,10 +200,7 @@ def print_session_history(events: list[EventData]) -> None:
     t.add_column("Duration", justify="right")
 
     for idx, ev in enumerate(events, 1):
-        try:
-            date_display = datetime.strptime(ev.date, "%Y-%m-%d").strftime("%a %b %d")
-        except ValueError:
-            date_display = ev.date
+        date_display = _format_date(ev.date, "%a %b %d")
         t.add_row(str(idx), date_display, ev.time, ev.title, f"{ev.duration} min")
 
     console.print(t)
@@ -239,10 +237,7 @@ def print_multicommand_preview(
         if cmd.date_label:
             date_str = cmd.date_label
         elif cmd.dates:
-            try:
-                date_str = datetime.strptime(cmd.dates[0], "%Y-%m-%d").strftime("%b %d (%a)")
-            except ValueError:
-                date_str = cmd.dates[0]
+            date_str = _format_date(cmd.dates[0], "%b %d (%a)")
         else:
             date_str = "—"
 
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from datetime import date, datetime, timedelta, tzinfo
+from functools import lru_cache
 
 import httpx
 
-from aion.config import get_config, get_now, get_tokens, save_tokens
+from aion.config import get_config, get_now, get_tokens, get_tz, json_loads, save_tokens
 
 BASE_URL = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
 TOKEN_URL = "https://oauth2.googleapis.com/token"
 
 
-@dataclass
+@dataclass(slots=True)
 class EventData:
     id: str
     title: str
@@ -38,30 +39,42 @@ class EventData:
 
 def _parse_rfc3339(s: str) -> datetime:
     """Parse RFC3339 datetime (e.g. '2026-02-16T09:00:00-05:00')."""
-    if s[-3] == ":" and (s[-6] == "+" or s[-6] == "-"):
-        s = s[:-3] + s[-2:]
+    if s.endswith("Z"):  # fromisoformat() only accepts "Z" from Python 3.11
+        s = s[:-1] + "+00:00"
     try:
-        return datetime.strptime(s, "%Y-%m-%dT%H:%M:%S%z")
+        return datetime.fromisoformat(s)
     except ValueError:
-        return datetime.strptime(s[:19], "%Y-%m-%dT%H:%M:%S")
+        return datetime.fromisoformat(s[:19])
+
+
+@lru_cache(maxsize=128)
+def _local_midnight(day: str, tz: tzinfo) -> str:
+    """RFC3339 timestamp for 00:00 local time on a YYYY-MM-DD day (offset is per day for DST)."""
+    return f"{day}T00:00:00{datetime.fromisoformat(day).replace(tzinfo=tz).strftime('%z')}"
+
+
+def _add_days(day: str, days: int) -> str:
+    return (date.fromisoformat(day) + timedelta(days=days)).isoformat()
 
 
 def _parse_gcal_event(raw: dict) -> EventData | None:
     """Convert a Google Calendar API event to EventData."""
-    start_str = raw.get("start", {}).get("dateTime")
-    if not start_str:
+    try:
+        start_str = raw["start"]["dateTime"]
+    except KeyError:
         return None  # skip all-day events
 
-    end_str = raw.get("end", {}).get("dateTime", start_str)
+    end_str = raw.get("end", raw["start"]).get("dateTime", start_str)
     start_dt = _parse_rfc3339(start_str)
     end_dt = _parse_rfc3339(end_str)
     duration = max(int((end_dt - start_dt).total_seconds() / 60), 15)
 
+    # RFC3339 already carries the local date/time in canonical form — slice, don't format
     return EventData(
         id=raw.get("id", ""),
         title=raw.get("summary", "(no title)"),
-        date=start_dt.strftime("%Y-%m-%d"),
-        time=start_dt.strftime("%H:%M"),
+        date=start_str[:10],
+        time=start_str[11:16],
         duration=duration,
         description=raw.get("description", ""),
     )
@@ -76,6 +89,20 @@ class GoogleCalendar:
             raise RuntimeError("Not logged in. Run 'aion login' first.")
         self._access_token = tokens["access_token"]
         self._refresh_token = tokens.get("refresh_token", "")
+        # One pooled client for the session — reuses TCP/TLS connections across calls
+        self._client = httpx.AsyncClient()
+        # Concurrent requests (list_events_multi) can all hit 401 at once; refresh only once
+        self._refresh_lock = asyncio.Lock()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> GoogleCalendar:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     def _headers(self) -> dict[str, str]:
         return {"Authorization": f"Bearer {self._access_token}"}
@@ -85,9 +112,13 @@ class GoogleCalendar:
         if resp.status_code != 401 or not self._refresh_token:
             return False
 
-        cfg = get_config()
-        async with httpx.AsyncClient() as client:
-            r = await client.post(
+        sent_auth = resp.request.headers.get("Authorization")
+        async with self._refresh_lock:
+            if sent_auth != self._headers()["Authorization"]:
+                return True  # another request already refreshed while this one was in flight
+
+            cfg = get_config()
+            r = await self._client.post(
                 TOKEN_URL,
                 data={
                     "client_id": cfg.get("google_client_id", ""),
@@ -100,15 +131,15 @@ class GoogleCalendar:
                 raise RuntimeError(
                     "Google session expired. Run 'login' to reconnect."
                 )
-            data = r.json()
-
-        self._access_token = data["access_token"]
-        save_tokens({
-            "access_token": self._access_token,
-            "refresh_token": self._refresh_token,
-            "expires_in": data.get("expires_in", 3600),
-            "token_type": data.get("token_type", "Bearer"),
-        })
+            data = json_loads(r.content)
+
+            self._access_token = data["access_token"]
+            save_tokens({
+                "access_token": self._access_token,
+                "refresh_token": self._refresh_token,
+                "expires_in": data.get("expires_in", 3600),
+                "token_type": data.get("token_type", "Bearer"),
+            })
         return True
 
     async def list_events(self, date: str | None = None) -> list[EventData]:
@@ -120,24 +151,21 @@ class GoogleCalendar:
             "maxResults": "100",
             "timeZone": tz,
         }
-        tz_info = ZoneInfo(tz)
+        tz_info = get_tz()
         if date:
-            d = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=tz_info)
-            params["timeMin"] = d.strftime("%Y-%m-%dT00:00:00%z")
-            params["timeMax"] = (d + timedelta(days=1)).strftime("%Y-%m-%dT00:00:00%z")
+            params["timeMin"] = _local_midnight(date, tz_info)
+            params["timeMax"] = _local_midnight(_add_days(date, 1), tz_info)
         else:
-            now = get_now()
-            day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            params["timeMin"] = day_start.strftime("%Y-%m-%dT00:00:00%z")
-            params["timeMax"] = (day_start + timedelta(days=8)).strftime("%Y-%m-%dT00:00:00%z")
+            today = get_now().date().isoformat()
+            params["timeMin"] = _local_midnight(today, tz_info)
+            params["timeMax"] = _local_midnight(_add_days(today, 8), tz_info)
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(BASE_URL, params=params, headers=self._headers())
-            if await self._refresh_if_needed(resp):
-                resp = await client.get(BASE_URL, params=params, headers=self._headers())
-            resp.raise_for_status()
+        resp = await self._client.get(BASE_URL, params=params, headers=self._headers())
+        if await self._refresh_if_needed(resp):
+            resp = await self._client.get(BASE_URL, params=params, headers=self._headers())
+        resp.raise_for_status()
 
-        events = [ev for item in resp.json().get("items", []) if (ev := _parse_gcal_event(item))]
+        events = [ev for item in json_loads(resp.content).get("items", []) if (ev := _parse_gcal_event(item))]
 
         # Filter to exact date if specified (API padding may include adjacent days)
         if date:
@@ -145,28 +173,29 @@ class GoogleCalendar:
 
         return events
 
+    async def list_events_multi(self, dates: list[str]) -> list[list[EventData]]:
+        """List events for several specific dates concurrently (one result list per date)."""
+        return list(await asyncio.gather(*(self.list_events(d) for d in dates)))
+
     async def list_events_range(self, start_date: str, end_date: str) -> list[EventData]:
         """List events across a date range (inclusive)."""
         tz = get_config().get("timezone", "UTC")
-        tz_info = ZoneInfo(tz)
-        d_start = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=tz_info)
-        d_end = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=tz_info)
+        tz_info = get_tz()
         params: dict[str, str] = {
             "singleEvents": "true",
             "orderBy": "startTime",
             "maxResults": "250",
             "timeZone": tz,
-            "timeMin": d_start.strftime("%Y-%m-%dT00:00:00%z"),
-            "timeMax": (d_end + timedelta(days=1)).strftime("%Y-%m-%dT00:00:00%z"),
+            "timeMin": _local_midnight(start_date, tz_info),
+            "timeMax": _local_midnight(_add_days(end_date, 1), tz_info),
         }
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(BASE_URL, params=params, headers=self._headers())
-            if await self._refresh_if_needed(resp):
-                resp = await client.get(BASE_URL, params=params, headers=self._headers())
-            resp.raise_for_status()
+        resp = await self._client.get(BASE_URL, params=params, headers=self._headers())
+        if await self._refresh_if_needed(resp):
+            resp = await self._client.get(BASE_URL, params=params, headers=self._headers())
+        resp.raise_for_status()
 
-        events = [ev for item in resp.json().get("items", []) if (ev := _parse_gcal_event(item))]
+        events = [ev for item in json_loads(resp.content).get("items", []) if (ev := _parse_gcal_event(item))]
         # Filter to exact range
         return [ev for ev in events if start_date <= ev.date <= end_date]
 
@@ -183,14 +212,13 @@ class GoogleCalendar:
             "end": {"dateTime": end_dt.strftime("%Y-%m-%dT%H:%M:%S"), "timeZone": tz},
         }
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(BASE_URL, json=body, headers=self._headers())
-            if await self._refresh_if_needed(resp):
-                resp = await client.post(BASE_URL, json=body, headers=self._headers())
-            resp.raise_for_status()
+        resp = await self._client.post(BASE_URL, json=body, headers=self._headers())
+        if await self._refresh_if_needed(resp):
+            resp = await self._client.post(BASE_URL, json=body, headers=self._headers())
+        resp.raise_for_status()
 
         return EventData(
-            id=resp.json().get("id", ""),
+            id=json_loads(resp.content).get("id", ""),
             title=title, date=date, time=time,
             duration=duration, description=description,
         )
@@ -199,12 +227,11 @@ class GoogleCalendar:
         """Update an existing event."""
         url = f"{BASE_URL}/{event_id}"
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers=self._headers())
-            if await self._refresh_if_needed(resp):
-                resp = await client.get(url, headers=self._headers())
-            resp.raise_for_status()
-            current = resp.json()
+        resp = await self._client.get(url, headers=self._headers())
+        if await self._refresh_if_needed(resp):
+            resp = await self._client.get(url, headers=self._headers())
+        resp.raise_for_status()
+        current = json_loads(resp.content)
 
         if "title" in changes:
             current["summary"] = changes["title"]
@@ -220,19 +247,17 @@ class GoogleCalendar:
             current["start"] = {"dateTime": start_dt.strftime("%Y-%m-%dT%H:%M:%S"), "timeZone": tz}
             current["end"] = {"dateTime": end_dt.strftime("%Y-%m-%dT%H:%M:%S"), "timeZone": tz}
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.put(url, json=current, headers=self._headers())
-            if await self._refresh_if_needed(resp):
-                resp = await client.put(url, json=current, headers=self._headers())
-            resp.raise_for_status()
+        resp = await self._client.put(url, json=current, headers=self._headers())
+        if await self._refresh_if_needed(resp):
+            resp = await self._client.put(url, json=current, headers=self._headers())
+        resp.raise_for_status()
 
-        return _parse_gcal_event(resp.json())
+        return _parse_gcal_event(json_loads(resp.content))
 
     async def delete_event(self, event_id: str) -> None:
         """Delete an event."""
         url = f"{BASE_URL}/{event_id}"
-        async with httpx.AsyncClient() as client:
-            resp = await client.delete(url, headers=self._headers())
-            if await self._refresh_if_needed(resp):
-                resp = await client.delete(url, headers=self._headers())
-            resp.raise_for_status()
+        resp = await self._client.delete(url, headers=self._headers())
+        if await self._refresh_if_needed(resp):
+            resp = await self._client.delete(url, headers=self._headers())
+        resp.raise_for_status()
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from aion.date_parser import parse_date_from_query
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedCommand:
     intent: str                        # SCHEDULE, LIST, DELETE, UPDATE, FIND_FREE, FIND_OPTIMAL, HELP, UNKNOWN
     activity: str | None = None        # "gym", "meeting with John"
@@ -27,26 +28,27 @@ class ParsedCommand:
         return self.label or self.activity
 
 
-# (intent_name, pattern, priority) — higher priority checked first
-_INTENT_PATTERNS: list[tuple[str, re.Pattern, int]] = [
-    ("HELP", re.compile(
-        r"^(?:help|commands|what can you do|how do(?:es)? (?:this|it) work)\s*\??$", re.I), 10),
-    ("PREFERENCES", re.compile(
-        r"\b(?:preferences?|settings?|blocked?\s*(?:slots?|times?)?|configure)\b", re.I), 8),
-    ("FIND_OPTIMAL", re.compile(
-        r"\b(?:best\s+time|optimal|when\s+should\s+i|suggest|recommend)\b", re.I), 9),
-    ("FIND_FREE", re.compile(
-        r"\b(?:free|available|open\s+slots?|when\s+am\s+i\s+free)\b", re.I), 8),
-    ("DELETE", re.compile(
-        r"\b(?:delete|cancel|remove)\b", re.I), 7),
-    ("UPDATE", re.compile(
-        r"\b(?:move|change|reschedule|update|push\s+back|bring\s+forward)\b", re.I), 7),
-    ("SCHEDULE", re.compile(
-        r"\b(?:schedule|add|create|book|set\s+up|plan)\b", re.I), 6),
-    ("LIST", re.compile(
-        r"\b(?:list|show|what'?s\s+on|events|calendar|plans|agenda|what\s+(?:do\s+)?i\s+have|check\s+(?:my\s+)?(?:calendar|events|schedule)|is\s+there\s+anything|anything\s+(?:on|today|tomorrow)|do\s+i\s+have|what\s+(?:event|meeting)|have\s+i\s+got|what'?s\s+(?:on\s+)?(?:my\s+)?(?:today|tomorrow|schedule)|what\s+(?:about\s+|(?:is\s+)?(?:there\s+|happening\s+)?(?:on\s+|in\s+|for\s+)?)?(?:today|tomorrow|(?:this|next)\s+week|(?:next\s+)?(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)))\b", re.I), 5),
+# (intent_name, pattern) — checked in list order, first match wins. Kept as source strings:
+# they are only ever compiled together, case-insensitively, as _INTENT_RE below.
+_INTENT_PATTERNS: list[tuple[str, str]] = [
+    ("HELP", r"^(?:help|commands|what can you do|how do(?:es)? (?:this|it) work)\s*\??$"),
+    ("PREFERENCES", r"\b(?:preferences?|settings?|blocked?\s*(?:slots?|times?)?|configure)\b"),
+    ("FIND_OPTIMAL", r"\b(?:best\s+time|optimal|when\s+should\s+i|suggest|recommend)\b"),
+    ("FIND_FREE", r"\b(?:free|available|open\s+slots?|when\s+am\s+i\s+free)\b"),
+    ("DELETE", r"\b(?:delete|cancel|remove)\b"),
+    ("UPDATE", r"\b(?:move|change|reschedule|update|push\s+back|bring\s+forward)\b"),
+    ("SCHEDULE", r"\b(?:schedule|add|create|book|set\s+up|plan)\b"),
+    ("LIST", r"\b(?:list|show|what'?s\s+on|events|calendar|plans|agenda|what\s+(?:do\s+)?i\s+have|check\s+(?:my\s+)?(?:calendar|events|schedule)|is\s+there\s+anything|anything\s+(?:on|today|tomorrow)|do\s+i\s+have|what\s+(?:event|meeting)|have\s+i\s+got|what'?s\s+(?:on\s+)?(?:my\s+)?(?:today|tomorrow|schedule)|what\s+(?:about\s+|(?:is\s+)?(?:there\s+|happening\s+)?(?:on\s+|in\s+|for\s+)?)?(?:today|tomorrow|(?:this|next)\s+week|(?:next\s+)?(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)))\b"),
 ]
 
+# All intent patterns fused into one regex. Each alternative is a lookahead anchored at
+# the start of the input and they are tried in list order, so the first intent whose
+# pattern occurs anywhere wins — the same precedence as searching them one by one.
+_INTENT_RE = re.compile(
+    "|".join(rf"(?=[\s\S]*?(?P<{name}>{pattern}))" for name, pattern in _INTENT_PATTERNS),
+    re.I,
+)
+
 _TIME_12H = re.compile(r"\bat\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)\b", re.I)
 _TIME_24H = re.compile(r"\bat\s+(\d{1,2}):(\d{2})\b")
 # Bare hour: "at 2", "at 10" — no am/pm, no minutes
@@ -56,52 +58,120 @@ _DURATION_SHORT = re.compile(r"\b(\d+(?:\.\d+)?)\s*(h|hr|hrs|min|mins)\b", re.I)
 _TIME_PREF = re.compile(r"\b(morning|afternoon|evening|night)\b", re.I)
 _LABEL = re.compile(r"\b(?:called|named|titled?|as)\s+[\"']?(.+?)[\"']?\s*$", re.I)
 
+# Fragments stripped from the input when extracting the activity name
+_PREAMBLE = re.compile(
+    r"^(?:(?:can|could|would)\s+you\s+(?:please\s+)?|please\s+|I\s+(?:want\s+to|need\s+to|'d\s+like\s+to)\s+)",
+    re.I,
+)
+_VERB_PATTERNS: dict[str, re.Pattern] = {
+    "SCHEDULE": re.compile(r"^(?:schedule|add|create|book|set\s+up|plan)\s+", re.I),
+    "DELETE": re.compile(r"^(?:delete|cancel|remove)\s+", re.I),
+    "UPDATE": re.compile(r"^(?:move|change|reschedule|update)\s+", re.I),
+    "FIND_OPTIMAL": re.compile(
+        r"^(?:find\s+(?:the\s+)?best\s+time\s+for\s+(?:a\s+)?|suggest\s+(?:a\s+)?time\s+for\s+(?:a\s+)?|when\s+should\s+i\s+)",
+        re.I,
+    ),
+}
+_FOR_ACTIVITY = re.compile(r"\bfor\s+(?![\d.]+\s*(?:hour|hr|h|min|m\b))(\w[\w\s]*?)\s*$", re.I)
+_DATE_WORDS = re.compile(r"\b(?:today|tomorrow|yesterday|this\s+week|next\s+week)\b", re.I)
+_WEEKDAY_WORDS = re.compile(r"\b(?:next\s+)?(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b", re.I)
+_MONTH_DAY = re.compile(
+    r"\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\s*\d{0,2}(?:st|nd|rd|th)?\b",
+    re.I,
+)
+_TRAILING_PREP = re.compile(r"\b(?:at|on|for|from|to|in\s+the)\b\s*$", re.I)
+_FILLER_WORDS = frozenset({"a", "an", "the", "my", "me"})
+
+# Removal fragments fused into alternations so each group is a single pass over the text.
+# Time/duration fragments go first so "june 30 min" loses "30 min" before the month-day
+# pattern can claim "june 30"; _TRAILING_PREP is end-anchored and must run last.
+# Patterns compiled without re.I (_TIME_24H) keep their case-sensitivity via a scoped flag.
+def _fuse(*patterns: re.Pattern) -> re.Pattern:
+    return re.compile(
+        "|".join(f"(?:{p.pattern})" if p.flags & re.I else f"(?-i:{p.pattern})" for p in patterns),
+        re.I,
+    )
+
 
-def _extract_time(text: str) -> str | None:
-    m = _TIME_12H.search(text)
-    if m:
-        hour = int(m.group(1))
-        minute = int(m.group(2) or 0)
-        if m.group(3).lower() == "pm" and hour != 12:
-            hour += 12
-        elif m.group(3).lower() == "am" and hour == 12:
-            hour = 0
-        return f"{hour:02d}:{minute:02d}"
-
-    m = _TIME_24H.search(text)
-    if m:
-        return f"{int(m.group(1)):02d}:{int(m.group(2)):02d}"
+_TIME_FRAGMENTS = _fuse(_TIME_12H, _TIME_24H, _TIME_BARE, _DURATION, _DURATION_SHORT, _TIME_PREF)
+_DATE_FRAGMENTS = _fuse(_DATE_WORDS, _WEEKDAY_WORDS, _MONTH_DAY)
 
-    # Bare hour: "at 2" → 14:00, "at 9" → 09:00
-    # Heuristic: 1-6 = PM (nobody schedules "at 2" meaning 2am), 7-12 = AM
-    m = _TIME_BARE.search(text)
-    if m:
-        hour = int(m.group(1))
-        if 1 <= hour <= 6:
-            hour += 12
-        if 0 <= hour <= 23:
-            return f"{hour:02d}:00"
+
+# Time/duration/preference patterns fused into one scan. Each alternative is a zero-width
+# lookahead, so matches of different kinds may overlap exactly as separate searches would;
+# _TIME_24H keeps its case-sensitive "at" via a scoped flag.
+_ENTITY_KINDS: dict[str, re.Pattern] = {
+    "t12": _TIME_12H, "t24": _TIME_24H, "bare": _TIME_BARE,
+    "dur": _DURATION, "dur_short": _DURATION_SHORT, "pref": _TIME_PREF,
+}
+_ENTITY_RE = re.compile(
+    "|".join(
+        rf"(?=(?P<{kind}>{p.pattern if p.flags & re.I else f'(?-i:{p.pattern})'}))"
+        for kind, p in _ENTITY_KINDS.items()
+    ),
+    re.I,
+)
+
+
+# 12-hour clock → 24-hour: (hour, "am"|"pm") → hour. Hours past 12 are already 24-hour.
+_HOUR_12H: dict[tuple[int, str], int] = {
+    (h, ap): h % 12 + (12 if ap == "pm" else 0) for h in range(13) for ap in ("am", "pm")
+}
+# Bare hour: "at 2" → 14:00, "at 9" → 09:00
+# Heuristic: 1-6 = PM (nobody schedules "at 2" meaning 2am), 7-12 = AM
+_BARE_HOUR: tuple[int, ...] = tuple(h + 12 if 1 <= h <= 6 else h for h in range(24))
+
+
+def _scan_entities(text: str) -> dict[str, tuple[str | None, ...]]:
+    """First match of each entity kind in one pass — kind → that pattern's capture groups."""
+    found: dict[str, tuple[str | None, ...]] = {}
+    for m in _ENTITY_RE.finditer(text):
+        kind = m.lastgroup
+        if kind not in found:
+            i = _ENTITY_RE.groupindex[kind]
+            found[kind] = m.groups()[i:i + _ENTITY_KINDS[kind].groups]
+    return found
+
+
+def _time_from(found: dict[str, tuple[str | None, ...]]) -> str | None:
+    g = found.get("t12")
+    if g:
+        hour = _HOUR_12H.get((int(g[0]), g[2].lower()), int(g[0]))
+        return f"{hour:02d}:{int(g[1] or 0):02d}"
+
+    g = found.get("t24")
+    if g:
+        return f"{int(g[0]):02d}:{int(g[1]):02d}"
+
+    g = found.get("bare")
+    if g and int(g[0]) < 24:
+        return f"{_BARE_HOUR[int(g[0])]:02d}:00"
 
     return None
 
 
-def _extract_duration(text: str) -> int | None:
-    m = _DURATION.search(text) or _DURATION_SHORT.search(text)
-    if m:
-        value = float(m.group(1))
-        unit = m.group(2).lower()
+def _duration_from(found: dict[str, tuple[str | None, ...]]) -> int | None:
+    g = found.get("dur") or found.get("dur_short")
+    if g:
+        value = float(g[0])
+        unit = g[1].lower()
         return int(value * 60) if unit.startswith("h") else int(value)
     return None
 
 
-def _extract_time_pref(text: str) -> str | None:
-    m = _TIME_PREF.search(text)
-    if m:
-        pref = m.group(1).lower()
+def _time_pref_from(found: dict[str, tuple[str | None, ...]]) -> str | None:
+    g = found.get("pref")
+    if g:
+        pref = g[0].lower()
         return "evening" if pref == "night" else pref
     return None
 
 
+def _extract_time(text: str) -> str | None:
+    return _time_from(_scan_entities(text))
+
+
 def _extract_label(text: str) -> tuple[str | None, str]:
     """Extract custom label and return (label, text_without_label)."""
     m = _LABEL.search(text)
@@ -113,45 +183,31 @@ def _extract_label(text: str) -> tuple[str | None, str]:
 
 
 def _extract_activity(text: str, intent: str) -> str | None:
-    """Extract the activity/event name from text by stripping known patterns."""
-    from aion.date_parser import _fix_typos
-    cleaned = _fix_typos(text.strip())
+    """Extract the activity/event name from text by stripping known patterns.
+
+    Expects text that regex_classify has already run through _fix_typos.
+    """
+    cleaned = text.strip()
 
     # Strip conversational preamble: "can you", "could you", "please", "I want to", etc.
-    cleaned = re.sub(
-        r"^(?:(?:can|could|would)\s+you\s+(?:please\s+)?|please\s+|I\s+(?:want\s+to|need\s+to|'d\s+like\s+to)\s+)",
-        "", cleaned, flags=re.I,
-    )
+    cleaned = _PREAMBLE.sub("", cleaned)
 
     # Check for "for <activity>" pattern at end (e.g. "add event for gym")
     # Only if "for" is NOT followed by a number (which would be duration)
-    for_activity = re.search(r"\bfor\s+(?![\d.]+\s*(?:hour|hr|h|min|m\b))(\w[\w\s]*?)\s*$", cleaned, re.I)
+    for_activity = _FOR_ACTIVITY.search(cleaned)
 
     # Remove the intent verb phrase
-    verb_patterns = {
-        "SCHEDULE": r"^(?:schedule|add|create|book|set\s+up|plan)\s+",
-        "DELETE": r"^(?:delete|cancel|remove)\s+",
-        "UPDATE": r"^(?:move|change|reschedule|update)\s+",
-        "FIND_OPTIMAL": r"^(?:find\s+(?:the\s+)?best\s+time\s+for\s+(?:a\s+)?|suggest\s+(?:a\s+)?time\s+for\s+(?:a\s+)?|when\s+should\s+i\s+)",
-    }
-    pat = verb_patterns.get(intent)
+    pat = _VERB_PATTERNS.get(intent)
     if pat:
-        cleaned = re.sub(pat, "", cleaned, flags=re.I)
+        cleaned = pat.sub("", cleaned)
 
     # Remove time/date/duration/preference fragments
-    removals = [
-        _TIME_12H, _TIME_24H, _TIME_BARE, _DURATION, _DURATION_SHORT, _TIME_PREF,
-        re.compile(r"\b(?:today|tomorrow|yesterday|this\s+week|next\s+week)\b", re.I),
-        re.compile(r"\b(?:next\s+)?(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b", re.I),
-        re.compile(r"\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\s*\d{0,2}(?:st|nd|rd|th)?\b", re.I),
-        re.compile(r"\b(?:at|on|for|from|to|in\s+the)\b\s*$", re.I),
-    ]
-    for r in removals:
-        cleaned = r.sub("", cleaned)
-
-    # Remove filler words
-    cleaned = re.sub(r"\b(?:a|an|the|my|me)\b", "", cleaned, flags=re.I)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip(" ,.-?!")
+    cleaned = _TIME_FRAGMENTS.sub("", cleaned)
+    cleaned = _DATE_FRAGMENTS.sub("", cleaned)
+    cleaned = _TRAILING_PREP.sub("", cleaned)
+
+    # Drop filler words and collapse whitespace in one pass over the tokens
+    cleaned = " ".join(w for w in cleaned.split() if w.lower() not in _FILLER_WORDS).strip(" ,.-?!")
 
     # If stripping left nothing useful but we found "for <activity>", use that
     if not cleaned and for_activity:
@@ -166,34 +222,44 @@ def _extract_activity(text: str, intent: str) -> str | None:
     return cleaned if cleaned else None
 
 
-def regex_classify(user_input: str) -> ParsedCommand:
-    """Classify intent and extract entities using regex patterns."""
-    from aion.date_parser import _fix_typos
-    text = _fix_typos(user_input.strip())
-    if not text:
-        return ParsedCommand(intent="UNKNOWN", raw=text, confidence=0.0)
+# Intents whose handlers never read dates. UNKNOWN still gets them: a split chunk may inherit
+# the previous intent, and the guided fallback can turn it into SCHEDULE/LIST/FIND_FREE.
+_DATELESS_INTENTS = frozenset({"HELP", "PREFERENCES"})
 
+
+@lru_cache(maxsize=512)
+def _classify_text(text: str) -> tuple[str, str | None, str | None, str | None, int | None, str | None]:
+    """Date-independent part of regex_classify, memoized on the typo-fixed text.
+
+    Returns (intent, label, activity, time, duration, time_pref). Dates are resolved per call
+    because they depend on today; ParsedCommand stays mutable, so callers get a fresh one.
+    """
     # Match intent
-    intent = "UNKNOWN"
-    confidence = 0.0
-    for name, pattern, _ in _INTENT_PATTERNS:
-        if pattern.search(text):
-            intent = name
-            confidence = 0.9
-            break
+    m = _INTENT_RE.match(text)
+    intent = m.lastgroup if m else "UNKNOWN"
 
     # Extract label first (strip "called/named/titled/as ..." from end)
     label, text_for_activity = _extract_label(text)
 
     # Extract entities
-    date_info = parse_date_from_query(text)
+    found = _scan_entities(text)
+    activity = _extract_activity(text_for_activity, intent) if intent in ("SCHEDULE", "DELETE", "UPDATE", "FIND_OPTIMAL") else None
+    return intent, label, activity, _time_from(found), _duration_from(found), _time_pref_from(found)
+
+
+def regex_classify(user_input: str) -> ParsedCommand:
+    """Classify intent and extract entities using regex patterns."""
+    from aion.date_parser import _fix_typos
+    text = _fix_typos(user_input.strip())
+    if not text:
+        return ParsedCommand(intent="UNKNOWN", raw=text, confidence=0.0)
+
+    intent, label, activity, time, duration, time_pref = _classify_text(text)
+    date_info = parse_date_from_query(text) if intent not in _DATELESS_INTENTS else {}
     dates = date_info.get("dates", [])
     date_label = date_info.get("label", "")
-    time = _extract_time(text)
-    duration = _extract_duration(text)
-    time_pref = _extract_time_pref(text)
-    activity = _extract_activity(text_for_activity, intent) if intent in ("SCHEDULE", "DELETE", "UPDATE", "FIND_OPTIMAL") else None
 
+    confidence = 0.9
     if intent != "UNKNOWN" and (dates or time or activity):
         confidence = min(confidence + 0.1, 1.0)
     if intent == "UNKNOWN":
@@ -213,19 +279,46 @@ def regex_classify(user_input: str) -> ParsedCommand:
     )
 
 
+# Read-only intents the regex handles reliably — no need for an LLM round trip
+_REGEX_TRACTABLE = frozenset({"LIST", "FIND_FREE"})
+
+# Write verbs. PREFERENCES and FIND_FREE are bare keywords checked before SCHEDULE, so
+# "add a free trial call" or "plan the settings review" match them — leave those to Ollama.
+_WRITE_VERB_RE = re.compile(
+    "|".join(pattern for name, pattern in _INTENT_PATTERNS if name in ("SCHEDULE", "UPDATE", "DELETE")),
+    re.I,
+)
+
+
+def _regex_is_enough(cmd: ParsedCommand) -> bool:
+    if cmd.intent == "HELP":
+        return True  # pattern spans the whole line, so nothing else can be meant
+    if _WRITE_VERB_RE.search(cmd.raw):
+        return False
+    # PREFERENCES never carries an activity or dates, so it never reaches 0.95 — and the
+    # Ollama reply schema has no such intent, so the regex result is the only right answer
+    if cmd.intent == "PREFERENCES":
+        return True
+    return cmd.confidence >= 0.95 and cmd.intent in _REGEX_TRACTABLE
+
+
 async def classify(user_input: str, events: list[dict] | None = None) -> ParsedCommand:
     """Classify intent — Ollama when available, regex as offline fallback."""
     from aion.ollama import ollama_available, ollama_classify
     from aion.config import get_config
 
-    if ollama_available() and get_config().get("ollama_enabled", True):
+    regex_result = regex_classify(user_input)
+    if _regex_is_enough(regex_result):
+        return regex_result
+
+    if await ollama_available() and get_config().get("ollama_enabled", True):
         try:
             return await ollama_classify(user_input, events)
         except Exception:
             pass
 
     # Ollama not available — offline regex fallback
-    return regex_classify(user_input)
+    return regex_result
 
 
 # ── Multi-command support ──────────────────────────────────────────────────────
@@ -281,10 +374,14 @@ async def classify_all(text: str, events: list[dict] | None = None) -> list[Pars
     from aion.ollama import ollama_available, ollama_classify_multi
     from aion.config import get_config
 
-    if ollama_available() and get_config().get("ollama_enabled", True):
+    regex_results = regex_split_and_classify(text)
+    if all(_regex_is_enough(cmd) for cmd in regex_results):
+        return regex_results
+
+    if await ollama_available() and get_config().get("ollama_enabled", True):
         try:
             return await ollama_classify_multi(text, events)
         except Exception:
             pass
 
-    return regex_split_and_classify(text)
+    return regex_results
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import threading
+import time
 from datetime import date as date_cls, timedelta
 
 import httpx
 
-from aion.config import get_config, get_now
+from aion.config import get_config, get_now, json_bytes, json_loads
 from aion.intent import ParsedCommand, _extract_time
 
 
@@ -17,7 +18,50 @@ def _clean(val: object) -> object:
         return None
     return val
 
+# Probe result is trusted for this long, so a server started mid-session is picked up
+_STATUS_TTL = 60.0  # seconds
 _ollama_status: bool | None = None
+_status_expires_at: float = 0.0
+
+
+_client: httpx.AsyncClient | None = None
+_warm_thread: threading.Thread | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Shared client — keeps the connection to the Ollama server alive between calls."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(timeout=30.0, limits=httpx.Limits(max_keepalive_connections=4))
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client (call once on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Structured-output schema (Ollama ≥ 0.5): forces an array of command objects, no preamble
+_NULLABLE_STR = {"type": ["string", "null"]}
+_REPLY_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "intent": {"enum": ["SCHEDULE", "LIST", "DELETE", "UPDATE", "FIND_FREE", "FIND_OPTIMAL"]},
+            "activity": _NULLABLE_STR,
+            "date": _NULLABLE_STR,
+            "date_end": _NULLABLE_STR,
+            "time": _NULLABLE_STR,
+            "duration": {"type": ["integer", "null"]},
+            "time_pref": {"enum": ["morning", "afternoon", "evening", None]},
+        },
+        "required": ["intent"],
+    },
+}
 
 
 def _url() -> str:
@@ -28,19 +72,64 @@ def _model() -> str:
     return get_config().get("ollama_model", "qwen2.5:0.5b")
 
 
-def ollama_available() -> bool:
-    """Check if Ollama is running (cached after first check)."""
-    global _ollama_status
-    if _ollama_status is not None:
+async def ollama_available() -> bool:
+    """Check if Ollama is running (cached for _STATUS_TTL seconds)."""
+    global _ollama_status, _status_expires_at
+    if _ollama_status is not None and time.monotonic() < _status_expires_at:
         return _ollama_status
     try:
-        r = httpx.get(f"{_url()}/api/tags", timeout=2.0)
+        r = await _get_client().get(f"{_url()}/api/tags", timeout=2.0)
         _ollama_status = r.status_code == 200
     except (httpx.ConnectError, httpx.TimeoutException):
         _ollama_status = False
+    _status_expires_at = time.monotonic() + _STATUS_TTL
+    if _ollama_status and _wants_warm_up(r):
+        _start_warm_up()
     return _ollama_status
 
 
+def _wants_warm_up(tags: httpx.Response) -> bool:
+    """Preload only for users who enabled Ollama in aion and have its model pulled.
+
+    get_config() always fills in a default ollama_model, so the /api/tags listing is what
+    tells a configured model apart from a server that is only running for other tools.
+    """
+    cfg = get_config()
+    model = cfg.get("ollama_model")
+    if not cfg.get("ollama_enabled", True) or not model:
+        return False
+    try:
+        names = {m.get("name") for m in json_loads(tags.content).get("models", [])}
+    except ValueError:
+        return False
+    return model in names or f"{model}:latest" in names
+
+
+def _start_warm_up() -> None:
+    """Load the model in the background (once per process) so the first command skips the cold start.
+
+    Runs on a daemon thread: the REPL blocks the event loop in Prompt.ask, so a loop task
+    would not send its request until the first command awaits something.
+    """
+    global _warm_thread
+    if _warm_thread is None:
+        _warm_thread = threading.Thread(target=_warm_up, name="ollama-warm-up", daemon=True)
+        _warm_thread.start()
+
+
+def _warm_up() -> None:
+    # An empty prompt makes Ollama load the model without generating anything
+    try:
+        httpx.post(
+            f"{_url()}/api/generate",
+            content=json_bytes({"model": _model(), "prompt": "", "stream": False}),
+            headers={"Content-Type": "application/json"},
+            timeout=120.0,
+        )
+    except httpx.HTTPError:
+        pass
+
+
 def reset_status() -> None:
     global _ollama_status
     _ollama_status = None
@@ -117,22 +206,7 @@ def _build_parsed_command(data: dict, user_input: str) -> ParsedCommand:
     )
 
 
-async def ollama_classify_multi(user_input: str, events: list[dict] | None = None) -> list[ParsedCommand]:
-    """Use Ollama to parse one or more commands from a single input string."""
-    now = get_now()
-    today = now.strftime("%Y-%m-%d")
-    weekday = now.strftime("%A")
-
-    if events:
-        summary = "\n".join(
-            f"- {e.get('date', '?')} {e.get('time', '?')}: {e.get('title', '?')} ({e.get('duration', 60)}min)"
-            for e in events[:20]
-        )
-    else:
-        summary = "(no events loaded)"
-
-    prompt = f"""You are a calendar command parser. Today is {today} ({weekday}).
-
+_PROMPT_RULES = """
 Intents:
 - LIST = user wants to SEE/VIEW events ("what tomorrow?", "what I have today", "show my calendar")
 - SCHEDULE = user wants to CREATE/ADD a new event ("schedule gym at 3pm", "add meeting tomorrow")
@@ -145,14 +219,9 @@ If the user is issuing a SINGLE command, return an array with one object.
 If the user is issuing MULTIPLE commands (e.g. "schedule gym today AND study tomorrow"),
 return an array with one object per command.
 
-User command: "{user_input}"
-
-Current events:
-{summary}
-
 Respond ONLY with a valid JSON array (no markdown, no explanation):
 [
-  {{
+  {
     "intent": "SCHEDULE|LIST|DELETE|UPDATE|FIND_FREE|FIND_OPTIMAL",
     "activity": "event title or null",
     "date": "relative phrase the user said (today/tomorrow/monday/next week/etc.) or YYYY-MM-DD if an explicit date was given, or null",
@@ -160,25 +229,66 @@ Respond ONLY with a valid JSON array (no markdown, no explanation):
     "time": "HH:MM in 24-hour format or null",
     "duration": "minutes as integer or null",
     "time_pref": "morning|afternoon|evening|null"
-  }}
-]"""
+  }
+]
+"""
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.post(
-            f"{_url()}/api/generate",
-            json={"model": _model(), "prompt": prompt, "stream": False, "options": {"temperature": 0.1}},
+
+async def ollama_classify_multi(user_input: str, events: list[dict] | None = None) -> list[ParsedCommand]:
+    """Use Ollama to parse one or more commands from a single input string."""
+    now = get_now()
+    today = now.strftime("%Y-%m-%d")
+    weekday = now.strftime("%A")
+
+    if events:
+        summary = "\n".join(
+            f"- {e.get('date', '?')} {e.get('time', '?')}: {e.get('title', '?')} ({e.get('duration', 60)}min)"
+            for e in events[:20]
         )
-        resp.raise_for_status()
+    else:
+        summary = "(no events loaded)"
 
-    raw = resp.json().get("response", "").strip()
+    # Static rules first and per-call text last, so Ollama can reuse the cached prompt prefix
+    prompt = (
+        f"You are a calendar command parser. Today is {today} ({weekday}).\n"
+        f"{_PROMPT_RULES}\n"
+        f"Current events:\n{summary}\n\n"
+        f'User command: "{user_input}"'
+    )
 
-    # Strip markdown code fences if present
-    text = raw
-    if "```" in text:
-        text = text.split("```")[1]
-        if text.startswith("json"):
-            text = text[4:]
-    parsed = json.loads(text.strip())
+    # The schema constrains decoding to a bare JSON array, so no markdown fences to strip.
+    # Stream tokens and stop as soon as the reply closes — no waiting on trailing tokens.
+    body = {
+        "model": _model(),
+        "prompt": prompt,
+        "stream": True,
+        "format": _REPLY_SCHEMA,
+        "options": {"temperature": 0.1},
+    }
+    parsed = None
+    pieces: list[str] = []
+    async with _get_client().stream(
+        "POST",
+        f"{_url()}/api/generate",
+        content=json_bytes(body),
+        headers={"Content-Type": "application/json"},
+    ) as resp:
+        resp.raise_for_status()
+        async for line in resp.aiter_lines():
+            if not line:
+                continue
+            chunk = json_loads(line)
+            pieces.append(chunk.get("response", ""))
+            if pieces[-1].rstrip().endswith(("]", "}")):
+                try:
+                    parsed = json_loads("".join(pieces))
+                    break
+                except ValueError:
+                    pass  # inner object or bracket inside a string — keep reading
+            if chunk.get("done"):
+                break
+    if parsed is None:
+        parsed = json_loads("".join(pieces))
 
     # Guard: some models return a plain object instead of an array
     if isinstance(parsed, dict):
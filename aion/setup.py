@@ -6,24 +6,48 @@ import platform
 import shutil
 import subprocess
 import sys
+import threading
 import time
 
 import httpx
 
-from aion.config import get_config, save_config
+from aion.config import get_config, json_loads, save_config
 
 DEFAULT_MODEL = "qwen2.5:3b"
+_PULL_TIMEOUT = 600  # seconds
+
+
+_ollama_bin: str | None = None
+
+
+def _ollama_path() -> str | None:
+    """Locate the ollama binary. A hit is remembered; a miss is re-checked since setup may install it."""
+    global _ollama_bin
+    if _ollama_bin is None:
+        _ollama_bin = shutil.which("ollama")
+    return _ollama_bin
 
 
 def _is_ollama_installed() -> bool:
     """Check if the ollama binary is on PATH."""
-    return shutil.which("ollama") is not None
+    return _ollama_path() is not None
+
+
+_client: httpx.Client | None = None
+
+
+def _get_client() -> httpx.Client:
+    """Shared keep-alive client for the local Ollama server (probes reuse one connection)."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(base_url="http://localhost:11434", timeout=2.0)
+    return _client
 
 
 def _is_ollama_running() -> bool:
-    """Check if the Ollama server is responding."""
+    """Check if the Ollama server is responding (GET / — a tiny "Ollama is running" body)."""
     try:
-        r = httpx.get("http://localhost:11434/api/tags", timeout=2.0)
+        r = _get_client().get("/")
         return r.status_code == 200
     except (httpx.ConnectError, httpx.TimeoutException):
         return False
@@ -32,9 +56,9 @@ def _is_ollama_running() -> bool:
 def _has_model(model: str) -> bool:
     """Check if a specific model is already pulled."""
     try:
-        r = httpx.get("http://localhost:11434/api/tags", timeout=5.0)
+        r = _get_client().get("/api/tags", timeout=5.0)
         if r.status_code == 200:
-            models = r.json().get("models", [])
+            models = json_loads(r.content).get("models", [])
             return any(m.get("name", "").startswith(model.split(":")[0]) for m in models)
     except (httpx.ConnectError, httpx.TimeoutException):
         pass
@@ -68,7 +92,7 @@ def install_ollama() -> bool:
                 with client.stream("GET", url) as resp:
                     resp.raise_for_status()
                     with open(installer_path, "wb") as f:
-                        for chunk in resp.iter_bytes(8192):
+                        for chunk in resp.iter_bytes(1 << 20):  # 1 MB writes
                             f.write(chunk)
             print("  Running installer (this may take a moment)...")
             subprocess.run([installer_path, "/VERYSILENT", "/NORESTART"], timeout=300)
@@ -99,7 +123,7 @@ def start_ollama() -> bool:
     if _is_ollama_running():
         return True
 
-    ollama_path = shutil.which("ollama")
+    ollama_path = _ollama_path()
     if not ollama_path:
         return False
 
@@ -117,11 +141,14 @@ def start_ollama() -> bool:
             start_new_session=True,
         )
 
-    # Wait for server to start
-    for _ in range(20):
-        time.sleep(0.5)
+    # Wait for server to start — poll fast at first, backing off to 0.5s, for up to 15s
+    delay = 0.025
+    deadline = time.monotonic() + 15.0
+    while time.monotonic() < deadline:
         if _is_ollama_running():
             return True
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.5)
     return False
 
 
@@ -129,14 +156,35 @@ def pull_model(model: str = DEFAULT_MODEL) -> bool:
     """Pull a model. Shows progress."""
     print(f"  Downloading model '{model}' (this may take a few minutes)...")
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["ollama", "pull", model],
-            timeout=600,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
         )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    except FileNotFoundError:
         return False
 
+    def relay() -> None:
+        # Text mode splits ollama's \r-updated bar into lines; show them on one line
+        for line in proc.stdout:
+            if line.strip():
+                print(f"\r  {line.strip():<72}", end="", flush=True)
+
+    # Relay on a thread so the deadline holds even while ollama prints nothing
+    reader = threading.Thread(target=relay, daemon=True)
+    reader.start()
+    try:
+        proc.wait(timeout=_PULL_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        pass
+    finally:
+        # Timed out or interrupted (Ctrl-C): don't leave the pull running
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        reader.join(timeout=1.0)
+        print()
+    return proc.returncode == 0
+
 
 def setup(model: str | None = None) -> bool:
     """Full setup: install Ollama, start server, pull model. Returns True on success."""
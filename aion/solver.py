@@ -1,9 +1,13 @@
 """Clingo-based Schedule Solver — finds optimal time slots for events."""
 
-import clingo
-
 from aion.asp_model import ASPModel
-from aion.config import get_now, get_preferences
+from aion.config import get_preferences
+
+
+def _span_mask(start: int, end: int, total: int) -> int:
+    """Bitmask covering slots [start, end) clipped to [0, total)."""
+    start, end = max(start, 0), min(end, total)
+    return ((1 << (end - start)) - 1) << start if end > start else 0
 
 
 class ScheduleSolver:
@@ -13,6 +17,8 @@ class ScheduleSolver:
     def find_available_slots(
         self, events: list[dict], request: dict, max_solutions: int = 5
     ) -> list[list[dict]]:
+        import clingo  # deferred: only optimal-slot searches need the solver
+
         if request.get("date"):
             dates = [request["date"]]
         else:
@@ -34,7 +40,11 @@ class ScheduleSolver:
         except Exception as e:
             return [{"error": f"Grounding error: {str(e)}"}]
 
-        solutions: list[list[dict]] = []
+        # optN also reports the improving models found on the way to the optimum,
+        # so keep each model's cost and rank the optimal ones first after solving
+        ranked: list[tuple[list[int], list[dict]]] = []
+        # Weekday atom → concrete date, resolved once rather than per schedule atom
+        weekday_to_date = {} if request.get("date") else {self.model.date_to_weekday(d): d for d in dates}
 
         def on_model(model):
             solution = []
@@ -43,14 +53,7 @@ class ScheduleSolver:
                     activity = str(atom.arguments[0]).strip('"')
                     day = str(atom.arguments[1])
                     slot = atom.arguments[2].number
-                    actual_date = None
-                    if request.get("date"):
-                        actual_date = request["date"]
-                    else:
-                        for date in dates:
-                            if self.model.date_to_weekday(date) == day:
-                                actual_date = date
-                                break
+                    actual_date = request.get("date") or weekday_to_date.get(day)
                     solution.append({
                         "activity": activity,
                         "day": day,
@@ -60,64 +63,50 @@ class ScheduleSolver:
                         "duration": request.get("duration", 60),
                     })
             solution.sort(key=lambda x: (x.get("date", ""), x["slot"]))
-            solutions.append(solution)
+            ranked.append((model.cost, solution))
 
         ctl.solve(on_model=on_model)
-        return solutions if solutions else []
+        ranked.sort(key=lambda r: r[0])  # stable: equal-cost models keep solver order
+        return [solution for _, solution in ranked]
 
     def find_free_slots(
         self, events: list[dict], date: str, min_duration: int = 30
     ) -> list[dict]:
-        busy_slots: set[int] = set()
+        total = self.model.total_slots
+        # One bit per slot; spans are clipped to the day window before masking
+        busy = 0
         for event in events:
             if event["date"] == date:
                 start = self.model.time_to_slot(event["time"])
                 duration = self.model.duration_to_slots(event["duration"])
-                for slot in range(start, min(start + duration, self.model.total_slots)):
-                    busy_slots.add(slot)
+                busy |= _span_mask(start, start + duration, total)
 
-        # Also block preference slots
+        # Also block preference slots (get_preferences already drops expired ones)
         prefs = get_preferences()
         weekday = self.model.date_to_weekday(date)
-        today = get_now().strftime("%Y-%m-%d")
         for block in prefs.get("blocked_slots", []):
-            until = block.get("until")
-            if until and until < today:
-                continue
             if weekday not in block.get("days", []):
                 continue
             start = self.model.time_to_slot(block["start"])
             end = self.model.time_to_slot(block["end"])
-            for slot in range(start, min(end, self.model.total_slots)):
-                busy_slots.add(slot)
+            busy |= _span_mask(start, end, total)
 
         free_slots: list[dict] = []
-        current_start = None
-
-        for slot in range(self.model.total_slots):
-            if slot not in busy_slots:
-                if current_start is None:
-                    current_start = slot
-            else:
-                if current_start is not None:
-                    duration_mins = (slot - current_start) * 30
-                    if duration_mins >= min_duration:
-                        free_slots.append({
-                            "start": self.model.slot_to_time(current_start),
-                            "end": self.model.slot_to_time(slot),
-                            "duration_mins": duration_mins,
-                            "date": date,
-                        })
-                    current_start = None
-
-        if current_start is not None:
-            duration_mins = (self.model.total_slots - current_start) * 30
+        free = ((1 << total) - 1) & ~busy
+        # Sentinel bit at `total` closes a run that reaches the end of the day
+        stops = busy | (1 << total)
+        while free:
+            run_start = (free & -free).bit_length() - 1
+            rest = stops >> run_start
+            run_end = run_start + (rest & -rest).bit_length() - 1
+            duration_mins = (run_end - run_start) * 30
             if duration_mins >= min_duration:
                 free_slots.append({
-                    "start": self.model.slot_to_time(current_start),
-                    "end": self.model.slot_to_time(self.model.total_slots),
+                    "start": self.model.slot_to_time(run_start),
+                    "end": self.model.slot_to_time(run_end),
                     "duration_mins": duration_mins,
                     "date": date,
                 })
+            free &= -1 << run_end
 
         return free_slots
@@ -0,0 +1,31 @@
+"""Tests for config persistence."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from aion import config
+
+_write_text = Path.write_text
+
+
+def _cp1252_locale_write_text(self, data, encoding=None, errors=None, newline=None):
+    """Path.write_text as it behaves on a cp1252-locale machine (e.g. Windows)."""
+    return _write_text(self, data, encoding=encoding or "cp1252", errors=errors, newline=newline)
+
+
+def test_non_ascii_labels_round_trip(tmp_path):
+    cfg_file = tmp_path / "config.json"
+    prefs = {"blocked_slots": [
+        {"label": "Café", "days": ["monday"], "start": "09:00", "end": "10:00"},
+        {"label": "会议", "days": ["tuesday"], "start": "14:00", "end": "15:00"},
+    ]}
+    with patch.object(config, "AION_DIR", tmp_path), \
+         patch.object(config, "CONFIG_FILE", cfg_file), \
+         patch.object(config, "_config_cache", None), \
+         patch.object(Path, "write_text", _cp1252_locale_write_text):
+        config.save_config({"preferences": prefs})
+        config._config_cache = None
+        loaded = config.get_config()
+
+    labels = [s["label"] for s in loaded["preferences"]["blocked_slots"]]
+    assert labels == ["Café", "会议"]
@@ -24,6 +24,16 @@ class TestRelativeDates:
         assert result["type"] == "date"
         assert result["dates"] == [expected]
 
+    def test_typo_with_punctuation(self):
+        result = parse_date_from_query("gym tmrw?")
+        expected = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        assert result["dates"] == [expected]
+
+    def test_typo_next_to_unicode_punctuation(self):
+        expected = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        for query in ("gym tmrw…", "gym “tmrw”", "gym tmrw—3pm"):
+            assert parse_date_from_query(query)["dates"] == [expected]
+
 
 class TestWeekDates:
     def test_this_week(self):
@@ -51,6 +61,12 @@ class TestWeekdayNames:
         dt = datetime.strptime(result["dates"][0], "%Y-%m-%d")
         assert dt.weekday() == 0  # Monday
 
+    def test_next_weekday_is_one_week_later(self):
+        day = (datetime.now() + timedelta(days=1)).strftime("%A").lower()
+        this = datetime.strptime(parse_date_from_query(f"gym {day}")["dates"][0], "%Y-%m-%d")
+        nxt = datetime.strptime(parse_date_from_query(f"gym next {day}")["dates"][0], "%Y-%m-%d")
+        assert nxt - this == timedelta(days=7)
+
 
 class TestSpecificDates:
     def test_month_day(self):
@@ -73,3 +89,11 @@ class TestNoMatch:
     def test_empty(self):
         result = parse_date_from_query("")
         assert result["type"] is None
+
+    def test_month_abbrev_needs_word_boundary(self):
+        result = parse_date_from_query("maybe later")
+        assert result["type"] is None
+
+    def test_weekday_abbrev_needs_word_boundary(self):
+        result = parse_date_from_query("plan the wedding")
+        assert result["type"] is None
@@ -0,0 +1,78 @@
+"""Tests for Google Calendar event parsing."""
+
+import asyncio
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import httpx
+import pytest
+
+from aion.google_cal import GoogleCalendar, _local_midnight, _parse_gcal_event
+
+
+class TestParseGcalEvent:
+    def test_timed_event(self):
+        ev = _parse_gcal_event({
+            "id": "abc",
+            "summary": "Gym",
+            "start": {"dateTime": "2026-02-18T09:30:00-05:00"},
+            "end": {"dateTime": "2026-02-18T10:45:00-05:00"},
+        })
+        assert ev.id == "abc"
+        assert ev.title == "Gym"
+        assert ev.date == "2026-02-18"
+        assert ev.time == "09:30"
+        assert ev.duration == 75
+
+    def test_utc_event(self):
+        ev = _parse_gcal_event({
+            "start": {"dateTime": "2026-02-18T23:00:00Z"},
+            "end": {"dateTime": "2026-02-19T00:30:00Z"},
+        })
+        assert ev.date == "2026-02-18"
+        assert ev.time == "23:00"
+        assert ev.duration == 90
+        assert ev.title == "(no title)"
+
+    def test_missing_end_defaults_to_minimum_duration(self):
+        ev = _parse_gcal_event({"start": {"dateTime": "2026-02-18T09:00:00+01:00"}})
+        assert ev.duration == 15
+
+    def test_all_day_event_skipped(self):
+        assert _parse_gcal_event({"start": {"date": "2026-02-18"}, "end": {"date": "2026-02-19"}}) is None
+
+
+class TestLocalMidnight:
+    def test_offset_follows_dst(self):
+        tz = ZoneInfo("America/New_York")
+        assert _local_midnight("2026-03-08", tz) == "2026-03-08T00:00:00-0500"
+        assert _local_midnight("2026-03-09", tz) == "2026-03-09T00:00:00-0400"
+
+
+class TestTokenRefresh:
+    @pytest.mark.asyncio
+    async def test_concurrent_401s_refresh_once(self):
+        with patch("aion.google_cal.get_tokens", return_value={"access_token": "old", "refresh_token": "r"}):
+            gcal = GoogleCalendar()
+
+        posts = []
+
+        async def post(url, data):
+            posts.append(url)
+            await asyncio.sleep(0)  # let the other 401s queue up on the lock
+            return httpx.Response(200, content=b'{"access_token": "new"}')
+
+        expired = [
+            httpx.Response(401, request=httpx.Request("GET", "https://x", headers=gcal._headers()))
+            for _ in range(3)
+        ]
+        with patch.object(gcal._client, "post", post), \
+             patch("aion.google_cal.get_config", return_value={}), \
+             patch("aion.google_cal.save_tokens") as save:
+            refreshed = await asyncio.gather(*(gcal._refresh_if_needed(r) for r in expired))
+        await gcal.aclose()
+
+        assert refreshed == [True, True, True]
+        assert len(posts) == 1
+        save.assert_called_once()
+        assert gcal._headers()["Authorization"] == "Bearer new"
@@ -1,6 +1,10 @@
 """Tests for intent classification and entity extraction."""
 
-from aion.intent import regex_classify
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aion.intent import classify_all, regex_classify
 
 
 class TestScheduleIntent:
@@ -36,6 +40,16 @@ class TestScheduleIntent:
         assert cmd.intent == "SCHEDULE"
         assert cmd.time == "09:00"
 
+    def test_activity_whitespace_collapsed(self):
+        cmd = regex_classify("schedule\tdentist\n  appointment   tomorrow")
+        assert cmd.activity == "dentist appointment"
+
+    def test_capitalized_at_24h_time_left_in_activity(self):
+        # 24-hour "at" is case-sensitive in extraction, so removal must not strip it either
+        cmd = regex_classify("Move yoga class tomorrow At 14:30")
+        assert cmd.time is None
+        assert cmd.activity == "yoga class At 14:30"
+
 
 class TestListIntent:
     def test_whats_on(self):
@@ -109,6 +123,13 @@ class TestHelpIntent:
         assert cmd.intent == "HELP"
 
 
+class TestIntentPrecedence:
+    def test_higher_priority_intent_wins_regardless_of_position(self):
+        # SCHEDULE appears first in the text, but DELETE is checked before it
+        cmd = regex_classify("schedule gym then delete my meeting")
+        assert cmd.intent == "DELETE"
+
+
 class TestTimeExtraction:
     def test_12h_pm(self):
         cmd = regex_classify("schedule meeting at 3pm")
@@ -175,3 +196,54 @@ class TestConfidence:
     def test_empty_zero_confidence(self):
         cmd = regex_classify("")
         assert cmd.confidence == 0.0
+
+
+class TestRepeatedInput:
+    def test_mutating_result_does_not_leak(self):
+        first = regex_classify("schedule gym tomorrow")
+        first.activity = "yoga"
+        first.dates.append("2000-01-01")
+        second = regex_classify("schedule gym tomorrow")
+        assert second.activity == "gym"
+        assert "2000-01-01" not in second.dates
+
+
+class TestOllamaShortCircuit:
+    @pytest.mark.asyncio
+    async def test_confident_list_skips_ollama(self):
+        probe = AsyncMock(return_value=True)
+        with patch("aion.ollama.ollama_available", probe):
+            cmds = await classify_all("what's on tomorrow")
+        assert [c.intent for c in cmds] == ["LIST"]
+        probe.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_help_and_preferences_skip_ollama(self):
+        probe = AsyncMock(return_value=True)
+        with patch("aion.ollama.ollama_available", probe):
+            help_cmds = await classify_all("what can you do")
+            pref_cmds = await classify_all("show my preferences")
+        assert [c.intent for c in help_cmds] == ["HELP"]
+        assert [c.intent for c in pref_cmds] == ["PREFERENCES"]
+        probe.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_keyword_intents_with_write_verb_consult_ollama(self):
+        inputs = [
+            "add a free trial call tomorrow",
+            "schedule lunch with John tomorrow when he is available",
+            "plan the settings review tomorrow at 3pm",
+        ]
+        for text in inputs:
+            probe = AsyncMock(return_value=False)
+            with patch("aion.ollama.ollama_available", probe):
+                await classify_all(text)
+            probe.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_schedule_still_consults_ollama(self):
+        probe = AsyncMock(return_value=False)
+        with patch("aion.ollama.ollama_available", probe):
+            cmds = await classify_all("schedule gym tomorrow")
+        assert cmds[0].intent == "SCHEDULE"
+        probe.assert_awaited_once()
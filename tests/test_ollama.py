@@ -0,0 +1,128 @@
+"""Tests for the Ollama availability probe."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import aion.ollama as ollama
+
+_CFG = {"ollama_enabled": True, "ollama_model": "qwen2.5:3b"}
+_TAGS = b'{"models": [{"name": "qwen2.5:3b"}]}'
+
+
+def _fake_client(status_code: int, content: bytes = _TAGS) -> MagicMock:
+    client = MagicMock()
+    client.get = AsyncMock(return_value=MagicMock(status_code=status_code, content=content))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_status_cached_until_ttl_expires():
+    ollama.reset_status()
+    client = _fake_client(200)
+    with patch("aion.ollama._get_client", return_value=client), \
+         patch("aion.ollama.get_config", return_value=_CFG), \
+         patch("aion.ollama._start_warm_up") as warm_up, \
+         patch("aion.ollama.time.monotonic", return_value=100.0):
+        assert await ollama.ollama_available() is True
+        assert await ollama.ollama_available() is True
+    assert client.get.await_count == 1
+    warm_up.assert_called()
+
+    with patch("aion.ollama._get_client", return_value=client), \
+         patch("aion.ollama._start_warm_up"), \
+         patch("aion.ollama.time.monotonic", return_value=100.0 + ollama._STATUS_TTL + 1):
+        assert await ollama.ollama_available() is True
+    assert client.get.await_count == 2
+    ollama.reset_status()
+
+
+@pytest.mark.asyncio
+async def test_no_warm_up_unless_enabled_and_pulled():
+    cases = [
+        ({"ollama_enabled": False, "ollama_model": "qwen2.5:3b"}, _TAGS),  # disabled in aion
+        ({"ollama_model": "qwen2.5:3b"}, b'{"models": [{"name": "llama3:8b"}]}'),  # other tools' server
+    ]
+    for cfg, tags in cases:
+        ollama.reset_status()
+        with patch("aion.ollama._get_client", return_value=_fake_client(200, tags)), \
+             patch("aion.ollama.get_config", return_value=cfg), \
+             patch("aion.ollama._start_warm_up") as warm_up:
+            assert await ollama.ollama_available() is True
+        warm_up.assert_not_called()
+    ollama.reset_status()
+
+
+def _streaming_client(lines: list[str]) -> MagicMock:
+    async def aiter_lines():
+        for line in lines:
+            yield line
+
+    resp = MagicMock()
+    resp.aiter_lines = aiter_lines
+    stream = MagicMock()
+    stream.__aenter__ = AsyncMock(return_value=resp)
+    stream.__aexit__ = AsyncMock(return_value=False)
+    client = MagicMock()
+    client.stream = MagicMock(return_value=stream)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_classify_stops_reading_once_array_closes():
+    lines = [
+        '{"response": "[{\\"intent\\": \\"LIST\\", \\"date\\": \\"today\\"}", "done": false}',
+        '{"response": "]", "done": false}',
+        "not json — must never be read",
+    ]
+    with patch("aion.ollama._get_client", return_value=_streaming_client(lines)):
+        cmds = await ollama.ollama_classify_multi("what's on today")
+    assert [c.intent for c in cmds] == ["LIST"]
+    assert len(cmds[0].dates) == 1
+
+
+@pytest.mark.asyncio
+async def test_classify_accepts_single_object_reply():
+    lines = [
+        '{"response": "{\\"intent\\": \\"schedule\\", ", "done": false}',
+        '{"response": "\\"activity\\": \\"gym\\"}", "done": false}',
+        "not json — must never be read",
+    ]
+    with patch("aion.ollama._get_client", return_value=_streaming_client(lines)):
+        cmds = await ollama.ollama_classify_multi("schedule gym")
+    assert cmds[0].intent == "SCHEDULE"
+    assert cmds[0].activity == "gym"
+
+
+@pytest.mark.asyncio
+async def test_warm_up_sent_while_loop_is_blocked():
+    received = threading.Event()
+    paths: list[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            paths.append(self.path)
+            received.set()
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with patch("aion.ollama._url", return_value=f"http://127.0.0.1:{server.server_port}"), \
+             patch("aion.ollama._warm_thread", None):
+            ollama._start_warm_up()
+            ollama._start_warm_up()
+            # Block the event loop synchronously, as the REPL's Prompt.ask does
+            assert received.wait(timeout=5.0)
+            ollama._warm_thread.join(timeout=5.0)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert paths == ["/api/generate"]
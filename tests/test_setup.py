@@ -0,0 +1,82 @@
+"""Tests for Ollama setup helpers."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from aion import setup
+
+
+def test_start_ollama_polls_with_backoff():
+    with patch("aion.setup._is_ollama_running", side_effect=[False, False, False, True]), \
+         patch("aion.setup.shutil.which", return_value="/usr/bin/ollama"), \
+         patch("aion.setup._ollama_bin", None), \
+         patch("aion.setup.subprocess.Popen"), \
+         patch("aion.setup.time.sleep") as sleep:
+        assert setup.start_ollama() is True
+
+    delays = [c.args[0] for c in sleep.call_args_list]
+    assert delays[0] == 0.025
+    assert delays == sorted(delays)
+
+
+def test_ollama_path_remembers_only_hits():
+    with patch("aion.setup._ollama_bin", None), \
+         patch("aion.setup.shutil.which", side_effect=[None, "/usr/bin/ollama"]) as which:
+        assert setup._is_ollama_installed() is False
+        assert setup._is_ollama_installed() is True
+        assert setup._is_ollama_installed() is True
+    assert which.call_count == 2
+
+
+def test_pull_model_relays_progress(capsys):
+    real_popen = subprocess.Popen
+    script = "print('pulling manifest'); print('success')"
+    with patch("aion.setup.subprocess.Popen",
+               side_effect=lambda args, **kw: real_popen([sys.executable, "-c", script], **kw)):
+        assert setup.pull_model("qwen2.5:0.5b") is True
+    out = capsys.readouterr().out
+    assert "pulling manifest" in out
+    assert "success" in out
+
+
+def _silent_pull(procs: list):
+    """Popen stand-in: a child that never prints and never exits on its own."""
+    real_popen = subprocess.Popen
+
+    def spawn(args, **kw):
+        proc = real_popen([sys.executable, "-c", "import time; time.sleep(60)"], **kw)
+        procs.append(proc)
+        return proc
+    return spawn
+
+
+def test_pull_model_kills_silent_stall():
+    procs: list = []
+    with patch("aion.setup.subprocess.Popen", side_effect=_silent_pull(procs)), \
+         patch("aion.setup._PULL_TIMEOUT", 0.5):
+        assert setup.pull_model("qwen2.5:0.5b") is False
+    assert procs[0].poll() is not None
+
+
+def test_pull_model_kills_child_on_interrupt():
+    procs: list = []
+    spawn = _silent_pull(procs)
+
+    def interrupted(args, **kw):
+        proc = spawn(args, **kw)
+        real_wait = proc.wait
+
+        def wait(timeout=None):
+            if timeout is not None:
+                raise KeyboardInterrupt  # Ctrl-C while waiting on the pull
+            return real_wait()
+        proc.wait = wait
+        return proc
+
+    with patch("aion.setup.subprocess.Popen", side_effect=interrupted), \
+         pytest.raises(KeyboardInterrupt):
+        setup.pull_model("qwen2.5:0.5b")
+    assert procs[0].poll() is not None
@@ -9,8 +9,9 @@ _EMPTY_PREFS = {"blocked_slots": [], "default_time_pref": None}
 
 @patch("aion.solver.get_preferences", return_value=_EMPTY_PREFS)
 class TestFindFreeSlots:
-    def setup_method(self):
-        self.solver = ScheduleSolver()
+    @classmethod
+    def setup_class(cls):
+        cls.solver = ScheduleSolver()  # stateless between calls, so one per class
 
     def test_empty_calendar(self, _mock):
         slots = self.solver.find_free_slots([], "2026-02-18")
@@ -41,11 +42,20 @@ class TestFindFreeSlots:
         assert len(slots) == 1
         assert slots[0]["duration_mins"] == 960
 
+    def test_events_clipped_to_day_window(self, _mock):
+        events = [
+            {"date": "2026-02-18", "time": "05:00", "duration": 120},
+            {"date": "2026-02-18", "time": "21:00", "duration": 180},
+        ]
+        slots = self.solver.find_free_slots(events, "2026-02-18")
+        assert [(s["start"], s["end"]) for s in slots] == [("07:00", "21:00")]
+
 
 @patch("aion.solver.get_preferences", return_value=_EMPTY_PREFS)
 class TestFindAvailableSlots:
-    def setup_method(self):
-        self.solver = ScheduleSolver()
+    @classmethod
+    def setup_class(cls):
+        cls.solver = ScheduleSolver()
 
     def test_schedule_on_empty_day(self, _mock):
         request = {"activity": "gym", "duration": 60, "date": "2026-02-18"}
@@ -59,12 +69,12 @@ class TestFindAvailableSlots:
         request = {"activity": "meeting", "duration": 60, "date": "2026-02-18"}
         solutions = self.solver.find_available_slots(events, request)
         assert len(solutions) >= 1
+        model = self.solver.model
+        busy = 0b11 << model.time_to_slot("09:00")  # 60 min = 2 slots
         for sol in solutions:
             for item in sol:
-                slot_start = self.solver.model.time_to_slot(item["time"])
-                event_start = self.solver.model.time_to_slot("09:00")
-                event_end = event_start + 2  # 60 min = 2 slots
-                assert slot_start < event_start or slot_start >= event_end
+                span = (1 << model.duration_to_slots(item["duration"])) - 1
+                assert busy & (span << model.time_to_slot(item["time"])) == 0
 
     def test_prefer_morning(self, _mock):
         request = {
@@ -78,3 +88,14 @@ class TestFindAvailableSlots:
         best = solutions[0][0]
         hour = int(best["time"].split(":")[0])
         assert hour < 12
+
+    def test_prefer_evening_ranks_optimal_first(self, _mock):
+        request = {
+            "activity": "gym",
+            "duration": 60,
+            "date": "2026-02-18",
+            "prefer_evening": True,
+        }
+        solutions = self.solver.find_available_slots([], request)
+        assert len(solutions) >= 1
+        assert solutions[0][0]["time"] >= "18:00"